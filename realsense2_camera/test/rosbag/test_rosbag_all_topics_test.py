@@ -41,8 +41,17 @@ from pytest_rs_utils import delayed_launch_descr_with_parameters
 from pytest_rs_utils import get_rosbag_file_path
 from pytest_rs_utils import get_node_heirarchy
 
+_OUTDOORS = get_rosbag_file_path("outdoors_1color.bag")
+_BASE = {'color_width': '0',
+    'color_height': '0',
+    'depth_width': '0',
+    'depth_height': '0',
+    'infra_width': '0',
+    'infra_height': '0',
+    }
+
 
-test_params_all_topics = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+test_params_all_topics = {"rosbag_filename":_OUTDOORS,
     'camera_name': 'AllTopics',
     'enable_infra1':'true',
     'enable_infra2':'true',
@@ -60,7 +69,7 @@ the testcase, hence missing the published data by the test
 '''
 @pytest.mark.rosbag
 @pytest.mark.skipif (os.getenv('RS_ROS_REGRESSION', "not found") == "not found",reason="The test doesn't work in CI")
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_all_topics],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_all_topics],ids=["all_topics"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestAllTopics(pytest_rs_utils.RsTestBaseClass):
     def test_all_topics(self,delayed_launch_descr_with_parameters):
@@ -107,17 +116,10 @@ class TestAllTopics(pytest_rs_utils.RsTestBaseClass):
             assert self.process_data(themes), "Data check failed, probably the rosbag file changed?"
         finally:
             self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
 
-test_params_metadata_topics = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+test_params_metadata_topics = {**_BASE,
+    "rosbag_filename":_OUTDOORS,
     'camera_name': 'MetadataTopics',
-    'color_width': '0',
-    'color_height': '0',
-    'depth_width': '0',
-    'depth_height': '0',
-    'infra_width': '0',
-    'infra_height': '0',
     'enable_infra1':'true',
     'enable_infra2':'true',
     'align_depth.enable':'true',
@@ -127,7 +129,7 @@ Meta data tests are not consistent, values are different every time.
 Need a better way to check, so skipping the data checks
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_metadata_topics],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_metadata_topics],ids=["metadata_topics"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestMetaDataTopics(pytest_rs_utils.RsTestBaseClass):
     def test_metadata_topics(self,delayed_launch_descr_with_parameters):
@@ -175,17 +177,10 @@ class TestMetaDataTopics(pytest_rs_utils.RsTestBaseClass):
             assert self.process_data(themes), "Data check failed, probably the rosbag file changed?"
         finally:
             self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
 
-test_params_camera_info_topics = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+test_params_camera_info_topics = {**_BASE,
+    "rosbag_filename":_OUTDOORS,
     'camera_name': 'CameraInfoTopics',
-    'color_width': '0',
-    'color_height': '0',
-    'depth_width': '0',
-    'depth_height': '0',
-    'infra_width': '0',
-    'infra_height': '0',
     'enable_infra1':'true',
     'enable_infra2':'true',
     'align_depth.enable':'true',
@@ -194,7 +189,7 @@ test_params_camera_info_topics = {"rosbag_filename":get_rosbag_file_path("outdoo
 To test all topics published
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_camera_info_topics],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_camera_info_topics],ids=["camera_info_topics"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestCamerInfoTopics(pytest_rs_utils.RsTestBaseClass):
     def test_camera_info_topics(self,delayed_launch_descr_with_parameters):
@@ -290,6 +285,4 @@ class TestCamerInfoTopics(pytest_rs_utils.RsTestBaseClass):
             assert self.process_data(themes), "Data check failed, probably the rosbag file changed?"
         finally:
             self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
     
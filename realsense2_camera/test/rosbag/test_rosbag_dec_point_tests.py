@@ -34,111 +34,42 @@ from pytest_rs_utils import delayed_launch_descr_with_parameters
 from pytest_rs_utils import get_rosbag_file_path
 from pytest_rs_utils import get_node_heirarchy
 
-
-test_params_depth_avg_decimation_1 = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
-    'camera_name': 'Align_Depth_Color_1',
-    'color_width': '0',
+_OUTDOORS = get_rosbag_file_path("outdoors_1color.bag")
+_BASE = {'color_width': '0',
     'color_height': '0',
     'depth_width': '0',
     'depth_height': '0',
     'infra_width': '0',
     'infra_height': '0',
-    'decimation_filter.enable':'true'
     }
-'''
-This test was ported from rs2_test.py
-the command used to run is "python3 realsense2_camera/scripts/rs2_test.py depth_avg_decimation_1"
-'''
-@pytest.mark.rosbag
-@pytest.mark.parametrize("launch_descr_with_parameters", [test_params_depth_avg_decimation_1],indirect=True)
-@pytest.mark.launch(fixture=launch_descr_with_parameters)
-class TestDepthAvgDecimation1(pytest_rs_utils.RsTestBaseClass):
-    def test_depth_avg_decimation_1(self,launch_descr_with_parameters):
-        params = launch_descr_with_parameters[1]
-        data = pytest_rs_utils.ImageDepthGetData_decimation(params["rosbag_filename"])
-        themes = [
-        {'topic':get_node_heirarchy(params)+'/depth/image_rect_raw',
-         'msg_type':msg_Image,
-         'expected_data_chunks':1,
-         'data':data
-        }
-        ]
-        try:
-            ''' 
-            initialize, run and check the data 
-            '''
-            self.init_test("RsTest"+params['camera_name'])
-            ret = self.run_test(themes)
-            assert ret[0], ret[1]
-            assert self.process_data(themes)
-        finally:
-            self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
-
+_POINTS_AVG = np.array([1.28251814, -0.15839984, 4.82235184, 80.0, 160.0, 240.0], dtype=np.float64)
+_POINTS_AVG.setflags(write=False)
 
-test_params_depth_avg_1 = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
-    'camera_name': 'Depth_Avg_1',
-    'color_width': '0',
-    'color_height': '0',
-    'depth_width': '0',
-    'depth_height': '0',
-    'infra_width': '0',
-    'infra_height': '0',
-    }
-'''
-This test was ported from rs2_test.py
-the command used to run is "python3 realsense2_camera/scripts/rs2_test.py depth_avg_1"
-'''
-@pytest.mark.rosbag
-@pytest.mark.parametrize("launch_descr_with_parameters", [test_params_depth_avg_1],indirect=True)
-@pytest.mark.launch(fixture=launch_descr_with_parameters)
-class TestDepthAvg1(pytest_rs_utils.RsTestBaseClass):
-    def test_depth_avg_1(self,launch_descr_with_parameters):
-        params = launch_descr_with_parameters[1]
-        data = pytest_rs_utils.ImageDepthGetData(params["rosbag_filename"])
-        themes = [
-        {'topic':get_node_heirarchy(params)+'/depth/image_rect_raw',
-         'msg_type':msg_Image,
-         'expected_data_chunks':1,
-         'data':data
-        }
-        ]
-        try:
-            ''' 
-            initialize, run and check the data 
-            '''
-            self.init_test("RsTest"+params['camera_name'])
-            ret = self.run_test(themes)
-            assert ret[0], ret[1]
-            assert self.process_data(themes)
-        finally:
-            self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
-    
 
-test_params_depth_avg_decimation_1 = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+test_params_depth_avg_decimation_1 = {**_BASE,
+    "rosbag_filename":_OUTDOORS,
     'camera_name': 'Align_Depth_Color_1',
-    'color_width': '0',
-    'color_height': '0',
-    'depth_width': '0',
-    'depth_height': '0',
-    'infra_width': '0',
-    'infra_height': '0',
     'decimation_filter.enable':'true'
     }
+test_params_depth_avg_1 = {**_BASE,
+    "rosbag_filename":_OUTDOORS,
+    'camera_name': 'Depth_Avg_1',
+    }
 '''
-This test was ported from rs2_test.py
-the command used to run is "python3 realsense2_camera/scripts/rs2_test.py depth_avg_decimation_1"
+These tests were ported from rs2_test.py
+the commands used to run are "python3 realsense2_camera/scripts/rs2_test.py depth_avg_decimation_1"
+and "python3 realsense2_camera/scripts/rs2_test.py depth_avg_1"
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("launch_descr_with_parameters", [test_params_depth_avg_decimation_1],indirect=True)
+@pytest.mark.parametrize("launch_descr_with_parameters,get_data", [
+    (test_params_depth_avg_decimation_1, pytest_rs_utils.ImageDepthGetData_decimation),
+    (test_params_depth_avg_1, pytest_rs_utils.ImageDepthGetData),
+    ],ids=["depth_avg_decimation_1", "depth_avg_1"],indirect=["launch_descr_with_parameters"])
 @pytest.mark.launch(fixture=launch_descr_with_parameters)
-class TestDepthAvgDecimation1(pytest_rs_utils.RsTestBaseClass):
-    def test_depth_avg_decimation_1(self,launch_descr_with_parameters):
+class TestDepthAvg(pytest_rs_utils.RsTestBaseClass):
+    def test_depth_avg(self,launch_descr_with_parameters,get_data):
         params = launch_descr_with_parameters[1]
-        data = pytest_rs_utils.ImageDepthGetData_decimation(params["rosbag_filename"])
+        data = get_data(params["rosbag_filename"])
         themes = [
         {'topic':get_node_heirarchy(params)+'/depth/image_rect_raw',
          'msg_type':msg_Image,
@@ -156,18 +87,11 @@ class TestDepthAvgDecimation1(pytest_rs_utils.RsTestBaseClass):
             assert self.process_data(themes)
         finally:
             self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
 
 
-test_params_points_cloud_1 = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+test_params_points_cloud_1 = {**_BASE,
+    "rosbag_filename":_OUTDOORS,
     'camera_name': 'Points_cloud_1',
-    'color_width': '0',
-    'color_height': '0',
-    'depth_width': '0',
-    'depth_height': '0',
-    'infra_width': '0',
-    'infra_height': '0',
     'pointcloud.enable': 'true'
     }
 '''
@@ -175,9 +99,10 @@ This test was ported from rs2_test.py
 the command used to run is "python3 realsense2_camera/scripts/rs2_test.py points_cloud_1"
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_points_cloud_1],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_points_cloud_1],ids=["points_cloud_1"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestPointsCloud1(pytest_rs_utils.RsTestBaseClass):
+    _parent_process_data = pytest_rs_utils.RsTestBaseClass.process_data
     def test_points_cloud_1(self,delayed_launch_descr_with_parameters):
         params = delayed_launch_descr_with_parameters[1]
         self.rosbag = params["rosbag_filename"]
@@ -201,8 +126,8 @@ class TestPointsCloud1(pytest_rs_utils.RsTestBaseClass):
     def process_data(self, themes):
         data = {'width': [660353, 3300], 
                 'height': [1], 
-                'avg': [np.array([ 1.28251814, -0.15839984, 4.82235184, 80, 160, 240])], 
+                'avg': [_POINTS_AVG], 
                 'epsilon': [0.04, 5]}
         themes[0]["data"] = data
-        return super().process_data(themes)
+        return self._parent_process_data(themes)
     
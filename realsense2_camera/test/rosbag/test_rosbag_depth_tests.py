@@ -38,15 +38,21 @@ from pytest_rs_utils import delayed_launch_descr_with_parameters
 from pytest_rs_utils import get_rosbag_file_path
 from pytest_rs_utils import get_node_heirarchy
 
-
-test_params_depth_points_cloud_1 = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
-    'camera_name': 'Points_cloud_1',
-    'color_width': '0',
+_OUTDOORS = get_rosbag_file_path("outdoors_1color.bag")
+_BASE = {'color_width': '0',
     'color_height': '0',
     'depth_width': '0',
     'depth_height': '0',
     'infra_width': '0',
     'infra_height': '0',
+    }
+_POINTS_AVG = np.array([1.28251814, -0.15839984, 4.82235184, 80.0, 160.0, 240.0], dtype=np.float64)
+_POINTS_AVG.setflags(write=False)
+
+
+test_params_depth_points_cloud_1 = {**_BASE,
+    "rosbag_filename":_OUTDOORS,
+    'camera_name': 'Points_cloud_1',
     'pointcloud.enable': 'true'
     }
 
@@ -60,7 +66,7 @@ Even then, the test fails sometimes due to the avg and epsilon value of points c
 a different rosbag file (or so its seems.)
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_depth_points_cloud_1],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_depth_points_cloud_1],ids=["depth_points_cloud_1"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestDepthPointsCloud1(pytest_rs_utils.RsTestBaseClass):
     def test_depth_points_cloud_1(self,delayed_launch_descr_with_parameters):
@@ -74,7 +80,7 @@ class TestDepthPointsCloud1(pytest_rs_utils.RsTestBaseClass):
         data2 = pytest_rs_utils.ImageDepthGetData(params["rosbag_filename"])
         data1 = {'width': [660353, 3300], 
                 'height': [1], 
-                'avg': [np.array([ 1.28251814, -0.15839984, 4.82235184, 80, 160, 240])], 
+                'avg': [_POINTS_AVG], 
                 'epsilon': [0.04, 5]}
         themes = [
         {'topic':get_node_heirarchy(params)+'/depth/color/points',
@@ -93,11 +99,9 @@ class TestDepthPointsCloud1(pytest_rs_utils.RsTestBaseClass):
             assert self.process_data(themes)
         finally:
             self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
 
 
-test_params_static_tf_1 = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+test_params_static_tf_1 = {"rosbag_filename":_OUTDOORS,
     'camera_name': 'Static_tf1',
     'color_width': '0',
     'color_height': '0',
@@ -111,7 +115,7 @@ This test was ported from rs2_test.py
 the command used to run is "python3 realsense2_camera/scripts/rs2_test.py static_tf_1"
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_static_tf_1],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_static_tf_1],ids=["static_tf_1"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestStaticTf1(pytest_rs_utils.RsTestBaseClass):
     def test_static_tf_1(self,delayed_launch_descr_with_parameters):
@@ -147,10 +151,8 @@ class TestStaticTf1(pytest_rs_utils.RsTestBaseClass):
                                                           (self.params['camera_name']+'_depth_frame', self.params['camera_name']+'_color_frame'): ([-0.00010158783697988838, 0.014841210097074509, -0.00022671300393994898], [-0.0008337442995980382, 0.0010442184284329414, -0.0009920650627464056, 0.9999986290931702]), 
                                                           (self.params['camera_name']+'_infra1_frame', self.params['camera_name']+'_color_frame'): ([-0.00010158783697988838, 0.014841210097074509, -0.00022671300393994898], [-0.0008337442995980382, 0.0010442184284329414, -0.0009920650627464056, 0.9999986290931702])}
         frame_ids = [self.params['camera_name']+'_link', self.params['camera_name']+'_depth_frame', self.params['camera_name']+'_infra1_frame', self.params['camera_name']+'_infra2_frame', self.params['camera_name']+'_color_frame', self.params['camera_name']+'_fisheye_frame', self.params['camera_name']+'_pose']
-        coupled_frame_ids = [xx for xx in itertools.combinations(frame_ids, 2)]
         data = self.node.pop_first_chunk('/tf_static')
-        coupled_frame_ids = [xx for xx in itertools.combinations(frame_ids, 2)]
-        tfs_data = self.get_transform_data(data, coupled_frame_ids, is_static=True)
+        tfs_data = self.get_transform_data(data, itertools.combinations(frame_ids, 2), is_static=True)
         ret = pytest_rs_utils.staticTFTest(tfs_data, expected_data)
         assert ret[0], ret[1]
         return ret[0]
@@ -164,11 +166,15 @@ This test was ported from rs2_test.py
 the command used to run is "python3 realsense2_camera/scripts/rs2_test.py static_tf_1"
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_non_existing_rosbag],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_non_existing_rosbag],ids=["non_existing_rosbag"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestNonExistingRosbag(pytest_rs_utils.RsTestBaseClass):
     def test_non_existing_rosbag(self,delayed_launch_descr_with_parameters):
+        '''
+        Check that the rs node doesn't come up when the rosbag file is missing.
+        '''
         params = delayed_launch_descr_with_parameters[1]
+        assert not os.path.isfile(params["rosbag_filename"]), params["rosbag_filename"] + " exists"
         try:
             ''' 
             initialize, run and check the data 
@@ -181,14 +187,9 @@ class TestNonExistingRosbag(pytest_rs_utils.RsTestBaseClass):
 
 
 
-test_params_align_depth_color_1 = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+test_params_align_depth_color_1 = {**_BASE,
+    "rosbag_filename":_OUTDOORS,
     'camera_name': 'Align_Depth_Color_1',
-    'color_width': '0',
-    'color_height': '0',
-    'depth_width': '0',
-    'depth_height': '0',
-    'infra_width': '0',
-    'infra_height': '0',
     'align_depth.enable':'true'
     }
 '''
@@ -196,7 +197,7 @@ This test was ported from rs2_test.py
 the command used to run is "python3 realsense2_camera/scripts/rs2_test.py align_depth_color_1"
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_align_depth_color_1],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_align_depth_color_1],ids=["align_depth_color_1"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestAlignDepthColor(pytest_rs_utils.RsTestBaseClass):
     def test_align_depth_color_1(self,delayed_launch_descr_with_parameters):
@@ -219,18 +220,11 @@ class TestAlignDepthColor(pytest_rs_utils.RsTestBaseClass):
             assert self.process_data(themes)
         finally:
             self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
 
 
-test_params_align_depth_infra_1 = {"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+test_params_align_depth_infra_1 = {**_BASE,
+    "rosbag_filename":_OUTDOORS,
     'camera_name': 'Align_Depth_Infra_1',
-    'color_width': '0',
-    'color_height': '0',
-    'depth_width': '0',
-    'depth_height': '0',
-    'infra_width': '0',
-    'infra_height': '0',
     'enable_infra1':'true',
     'enable_infra2':'true',
     'align_depth.enable':'true',
@@ -251,9 +245,10 @@ The following testcase is skipped due to a possible issue. It can be re-enabled
 '''
 @pytest.mark.skip
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_align_depth_infra_1],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_align_depth_infra_1],ids=["align_depth_infra_1"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestAlignDepthInfra1(pytest_rs_utils.RsTestBaseClass):
+    _parent_process_data = pytest_rs_utils.RsTestBaseClass.process_data
     def test_align_depth_infra_1(self,delayed_launch_descr_with_parameters):
         params = delayed_launch_descr_with_parameters[1]
         self.rosbag = params["rosbag_filename"]
@@ -278,4 +273,4 @@ class TestAlignDepthInfra1(pytest_rs_utils.RsTestBaseClass):
     def process_data(self, themes):
         data = pytest_rs_utils.ImageDepthInInfra1ShapeGetData(self.rosbag)
         themes[0]["data"] = data
-        return super().process_data(themes)
+        return self._parent_process_data(themes)
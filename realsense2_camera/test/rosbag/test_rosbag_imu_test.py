@@ -40,15 +40,19 @@ from pytest_rs_utils import delayed_launch_descr_with_parameters
 from pytest_rs_utils import get_rosbag_file_path
 from pytest_rs_utils import get_node_heirarchy
 
-
-test_params_accel = {"rosbag_filename":get_rosbag_file_path("D435i_Depth_and_IMU_Stands_still.bag"),
-    'camera_name': 'Accel_Cam',
-    'color_width': '0',
+_D435I = get_rosbag_file_path("D435i_Depth_and_IMU_Stands_still.bag")
+_BASE = {'color_width': '0',
     'color_height': '0',
     'depth_width': '0',
     'depth_height': '0',
     'infra_width': '0',
     'infra_height': '0',
+    }
+
+
+test_params_accel = {**_BASE,
+    "rosbag_filename":_D435I,
+    'camera_name': 'Accel_Cam',
     'enable_accel': 'true',
     'accel_fps': '0.0'
     }
@@ -57,7 +61,7 @@ This test was ported from rs2_test.py
 the command used to run is "python3 realsense2_camera/scripts/rs2_test.py accel_up_1"
 '''
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_accel],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_accel],ids=["accel_up_1"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestAccelUp1(pytest_rs_utils.RsTestBaseClass):
     def test_accel_up_1(self,delayed_launch_descr_with_parameters):
@@ -80,25 +84,18 @@ class TestAccelUp1(pytest_rs_utils.RsTestBaseClass):
             assert self.process_data(themes)
         finally:
             self.shutdown()
-    def process_data(self, themes):
-        return super().process_data(themes)
 
-test_params_imu_topics = {#"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
-                          "rosbag_filename":get_rosbag_file_path("D435i_Depth_and_IMU_Stands_still.bag"),
+test_params_imu_topics = {**_BASE,
+    #"rosbag_filename":get_rosbag_file_path("outdoors_1color.bag"),
+    "rosbag_filename":_D435I,
     'camera_name': 'ImuTopics',
-    'color_width': '0',
-    'color_height': '0',
-    'depth_width': '0',
-    'depth_height': '0',
-    'infra_width': '0',
-    'infra_height': '0',
     'enable_accel':True,
     'enable_gyro':True,
     'unite_imu_method':1,
     'delay_ms':3000, #delay the start
     }
 @pytest.mark.rosbag
-@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_imu_topics],indirect=True)
+@pytest.mark.parametrize("delayed_launch_descr_with_parameters", [test_params_imu_topics],ids=["imu_topics"],indirect=True)
 @pytest.mark.launch(fixture=delayed_launch_descr_with_parameters)
 class TestImuTopics(pytest_rs_utils.RsTestBaseClass):
     def test_imu_topics(self,delayed_launch_descr_with_parameters):
@@ -163,7 +163,7 @@ def ImageGetData(rec_filename, topic):
     res = dict()
     data = importRosbag(rec_filename, importTopics=[topic], log='ERROR', disable_bar=True)[topic]
     for pyimg in data['frames']:
-        ok_number = (pyimg != 0).sum()
+        ok_number = np.count_nonzero(pyimg)
         channels = pyimg.shape[2] if len(pyimg.shape) > 2 else 1
         ok_percent.append(float(ok_number) / (pyimg.shape[0] * pyimg.shape[1] * channels))
         all_avg.append(pyimg.sum() / ok_number)
@@ -232,11 +232,11 @@ def ImageColorTest(data, gt_data):
             return False, msg
         msg = 'Expected shape to be %s. Got %s' % (gt_data['shape'], list(set(data['shape']))[0])
         print (msg)
-        if (np.array(list(set(data['shape']))[0]) != np.array(gt_data['shape'])).any():
+        if not np.array_equal(list(set(data['shape']))[0], gt_data['shape']):
             return False, msg
         msg = 'Expected header [width, height, step] to be %s. Got %s' % (gt_data['reported_size'], list(set(data['reported_size']))[0])
         print (msg)
-        if (np.array(list(set(data['reported_size']))[0]) != np.array(gt_data['reported_size'])).any():
+        if not np.array_equal(list(set(data['reported_size']))[0], gt_data['reported_size']):
             return False, msg
         msg = 'Expect average of %.3f (+-%.3f). Got average of %.3f.' % (gt_data['avg'].mean(), gt_data['epsilon'], np.array(data['avg']).mean())
         print (msg)
@@ -698,7 +698,7 @@ class RsTestNode(Node):
                 channels = pyimg.shape[2] if len(pyimg.shape) > 2 else 1
                 #print("pyimg from callback:")
                 #print(pyimg)
-                ok_number = (pyimg != 0).sum()
+                ok_number = np.count_nonzero(pyimg)
                 func_data['avg'].append(pyimg.sum() / ok_number)
                 func_data['ok_percent'].append(float(ok_number) / (pyimg.shape[0] * pyimg.shape[1]) / channels)
                 func_data['num_channels'].append(channels)
@@ -942,12 +942,11 @@ class RsTestBaseClass():
             else:
                 tfBuffer.set_transform(transform, "default_authority")
         res = dict()
-        for couple in coupled_frame_ids:
-            from_id, to_id = couple
-            if (tfBuffer.can_transform(from_id, to_id, rclpy.time.Time(), rclpy.time.Duration(nanoseconds=3e6))):
-                res[couple] = tfBuffer.lookup_transform(from_id, to_id, rclpy.time.Time(), rclpy.time.Duration(nanoseconds=1e6)).transform
-            else:
-                res[couple] = None
+        for from_id, to_id in coupled_frame_ids:
+            try:
+                res[(from_id, to_id)] = tfBuffer.lookup_transform(from_id, to_id, rclpy.time.Time()).transform
+            except tf2_ros.TransformException:
+                res[(from_id, to_id)] = None
         return res
     def check_transform_data(self, data, frame_ids, is_static=False):
         coupled_frame_ids = [xx for xx in itertools.combinations(frame_ids, 2)]